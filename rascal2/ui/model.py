@@ -92,7 +92,9 @@ class MainWindowModel(QtCore.QObject):
             If the project files are not in a valid format.
 
         """
-        controls_file = Path(load_path, "controls.json")
+        project_folder = Path(load_path)
+
+        controls_file = project_folder / "controls.json"
         try:
             controls = RAT.Controls.load(controls_file)
         except ValueError as err:
@@ -101,13 +103,13 @@ class MainWindowModel(QtCore.QObject):
                 "It may contain invalid parameter values or be invalid JSON."
             ) from err
 
-        project_file = Path(load_path, "project.json")
+        project_file = project_folder / "project.json"
         try:
             project = RAT.Project.load(project_file)
             # TODO remove this when RascalSoftware/python-RAT/#126 is fixed
             # https://github.com/RascalSoftware/python-RAT/issues/126
             for file in project.custom_files:
-                file.path = Path(load_path, file.path)
+                file.path = project_folder / file.path
         except JSONDecodeError as err:
             raise ValueError("The project.json file for this project contains invalid JSON.") from err
         except (KeyError, ValueError) as err:
@@ -1,6 +1,7 @@
 """Widgets for validated user inputs."""
 
 from enum import Enum
+from functools import cache
 from math import floor, log10
 from pathlib import Path
 from typing import Callable
@@ -40,6 +41,25 @@ def get_validated_input(field_info: FieldInfo, parent=None) -> QtWidgets.QWidget
     return BaseInputWidget(field_info, parent)
 
 
+@cache
+def get_enum_items(enum: type[Enum]) -> tuple[tuple[str, ...], tuple[Enum, ...]]:
+    """Get the display names and members of an Enum, computed once per Enum.
+
+    Parameters
+    ----------
+    enum : type[Enum]
+        The Enum to get items for.
+
+    Returns
+    -------
+    tuple[tuple[str, ...], tuple[Enum, ...]]
+        The string names of the Enum members, and the members themselves.
+
+    """
+    members = tuple(enum)
+    return tuple(str(member) for member in members), members
+
+
 class BaseInputWidget(QtWidgets.QWidget):
     """Base class for input generated from Pydantic field info.
 
@@ -160,8 +180,10 @@ class EnumInputWidget(BaseInputWidget):
 
     def create_editor(self, field_info: FieldInfo) -> QtWidgets.QWidget:
         editor = QtWidgets.QComboBox(self)
-        for e in field_info.annotation:
-            editor.addItem(str(e), e)
+        names, members = get_enum_items(field_info.annotation)
+        editor.addItems(names)
+        for i, member in enumerate(members):
+            editor.setItemData(i, member)
 
         return editor
 
@@ -400,12 +422,7 @@ class MultiSelectComboBox(QtWidgets.QComboBox):
             The associated data. Default is None.
 
         """
-        item = QtGui.QStandardItem()
-        item.setText(text)
-        item.setData(data or text)
-        item.setFlags(QtCore.Qt.ItemFlag.ItemIsEnabled | QtCore.Qt.ItemFlag.ItemIsUserCheckable)
-        item.setData(QtCore.Qt.CheckState.Unchecked, QtCore.Qt.ItemDataRole.CheckStateRole)
-        self.model().appendRow(item)
+        self.model().appendRow(self.create_item(text, data))
 
     def addItems(self, texts: list, data_list: list = None) -> None:
         """Add multiple items to the combo box.
@@ -419,8 +436,33 @@ class MultiSelectComboBox(QtWidgets.QComboBox):
 
         """
         data_list = data_list or [None] * len(texts)
-        for text, data in zip(texts, data_list):
-            self.addItem(text, data)
+        # append all rows at once so the model and view only update once
+        items = [self.create_item(text, data) for text, data in zip(texts, data_list)]
+        self.model().invisibleRootItem().appendRows(items)
+
+    @staticmethod
+    def create_item(text: str, data: str = None) -> QtGui.QStandardItem:
+        """Create a checkable item for the combo box.
+
+        Parameters
+        ----------
+        text : str
+            The text to display.
+        data : str
+            The associated data. Default is None.
+
+        Returns
+        -------
+        QtGui.QStandardItem
+            The unchecked item.
+
+        """
+        item = QtGui.QStandardItem()
+        item.setText(text)
+        item.setData(data or text)
+        item.setFlags(QtCore.Qt.ItemFlag.ItemIsEnabled | QtCore.Qt.ItemFlag.ItemIsUserCheckable)
+        item.setData(QtCore.Qt.CheckState.Unchecked, QtCore.Qt.ItemDataRole.CheckStateRole)
+        return item
 
     def selected_items(self) -> list:
         """Get the currently selected data.
@@ -446,10 +488,16 @@ class MultiSelectComboBox(QtWidgets.QComboBox):
             A list of indexes to select.
 
         """
-        for i in range(self.model().rowCount()):
-            self.model().item(i).setCheckState(
-                QtCore.Qt.CheckState.Checked if i in indices else QtCore.Qt.CheckState.Unchecked
-            )
+        model = self.model()
+        # each check state change emits dataChanged, so only update the text once at the end
+        model.dataChanged.disconnect(self.update_text)
+        try:
+            for i in range(model.rowCount()):
+                model.item(i).setCheckState(
+                    QtCore.Qt.CheckState.Checked if i in indices else QtCore.Qt.CheckState.Unchecked
+                )
+        finally:
+            model.dataChanged.connect(self.update_text)
         self.update_text()
 
     def showEvent(self, event) -> None:
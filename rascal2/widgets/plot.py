@@ -15,6 +15,18 @@ class PlotWidget(QtWidgets.QWidget):
         super().__init__()
 
         self.current_plot_data = None
+        self.redraw_pending = False
+        self.layout_outdated = True
+        self.subplot_params = None
+        # plot inputs which only depend on the project structure are cached between results updates
+        self.project_inputs = None
+
+        # plot events in quick succession (e.g. live updates during a run) are
+        # throttled so that the plot is drawn at most once per timer interval
+        self.draw_timer = QtCore.QTimer(self)
+        self.draw_timer.setSingleShot(True)
+        self.draw_timer.setInterval(16)
+        self.draw_timer.timeout.connect(self.draw_plot)
 
         self.parent_model = parent.presenter.model
         main_layout = QtWidgets.QHBoxLayout()
@@ -42,12 +54,14 @@ class PlotWidget(QtWidgets.QWidget):
         self.figure.subplots(1, 2)
         self.canvas = FigureCanvas(self.figure)
         self.canvas.setParent(self)
+        self.canvas.installEventFilter(self)
         plot_layout.addWidget(self.canvas)
         self.setMinimumHeight(300)
 
         self.parent_model.results_updated.connect(
             lambda: self.plot(self.parent_model.project, self.parent_model.results)
         )
+        self.parent_model.project_updated.connect(self.clear_project_inputs)
 
     def create_plot_control(self):
         """Creates the controls for customising plot"""
@@ -107,14 +121,38 @@ class PlotWidget(QtWidgets.QWidget):
         data.shiftedData = results.shiftedData
         data.sldProfiles = results.sldProfiles
         data.resampledLayers = results.resampledLayers
-        data.dataPresent = RATapi.inputs.make_data_present(project)
         data.subRoughs = results.contrastParams.subRoughs
-        data.resample = RATapi.inputs.make_resample(project)
-        data.contrastNames = [contrast.name for contrast in project.contrasts]
+        data.dataPresent, data.resample, data.contrastNames = self.get_project_inputs(project)
         self.plot_event(data)
 
+    def get_project_inputs(self, project: RATapi.Project) -> tuple[list, list, list[str]]:
+        """Gets the plot inputs which depend only on the project, reusing cached values if possible.
+
+        Parameters
+        ----------
+        project : RATapi.Project
+            The project
+
+        Returns
+        -------
+        tuple[list, list, list[str]]
+            The data present flags, resample flags and contrast names for the project.
+        """
+        if self.project_inputs is None or self.project_inputs[0] is not project:
+            inputs = (
+                RATapi.inputs.make_data_present(project),
+                RATapi.inputs.make_resample(project),
+                [contrast.name for contrast in project.contrasts],
+            )
+            self.project_inputs = (project, inputs)
+        return self.project_inputs[1]
+
+    def clear_project_inputs(self):
+        """Clears the cached project plot inputs, e.g. when the project has been edited."""
+        self.project_inputs = None
+
     def plot_event(self, data: Optional[RATapi.events.PlotEventData] = None):
-        """Updates the ref and SLD plots from a provided or cached plot event
+        """Schedules an update of the ref and SLD plots from a provided or cached plot event
 
         Parameters
         ----------
@@ -125,9 +163,21 @@ class PlotWidget(QtWidgets.QWidget):
         if data is not None:
             self.current_plot_data = data
 
+        if self.current_plot_data is not None and not self.draw_timer.isActive():
+            self.draw_timer.start()
+
+    def draw_plot(self):
+        """Draws the ref and SLD plots from the cached plot event."""
         if self.current_plot_data is None:
             return
 
+        # drawing is expensive, so if the widget is hidden (e.g. its window is minimised)
+        # we wait and draw the latest data when it is next shown
+        if not self.isVisible():
+            self.redraw_pending = True
+            return
+        self.redraw_pending = False
+
         show_legend = self.show_legend.isChecked() if self.current_plot_data.contrastNames else False
         RATapi.plotting.plot_ref_sld_helper(
             self.current_plot_data,
@@ -139,11 +189,51 @@ class PlotWidget(QtWidgets.QWidget):
             show_grid=self.show_grid.isChecked(),
             show_legend=show_legend,
         )
-        self.figure.tight_layout(pad=1)
-        self.canvas.draw()
+        # the layout solver is expensive and only needs rerunning when the canvas size changes,
+        # so we save the subplot parameters it computes and reapply them on other draws, as
+        # the plot helper resets some of them on every call
+        if self.layout_outdated:
+            self.figure.tight_layout(pad=1)
+            subplot_params = self.figure.subplotpars
+            self.subplot_params = {
+                param: getattr(subplot_params, param)
+                for param in ("left", "right", "top", "bottom", "wspace", "hspace")
+            }
+            self.layout_outdated = False
+        else:
+            self.figure.subplots_adjust(**self.subplot_params)
+        self.canvas.draw_idle()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.redraw_pending:
+            self.draw_plot()
+
+    def eventFilter(self, obj, event) -> bool:
+        """Event filter to mark the figure layout as outdated when the canvas is resized.
+
+        Parameters
+        ----------
+        obj
+            The object emitting the event.
+        event
+            The event being emitted.
+
+        Returns
+        -------
+        bool
+            False, so that the event is always passed on to the canvas.
+
+        """
+        if event.type() == QtCore.QEvent.Type.Resize:
+            self.layout_outdated = True
+        return super().eventFilter(obj, event)
 
     def clear(self):
-        """Clear the canvas."""
+        """Clear the canvas and any plot data waiting to be drawn."""
+        self.draw_timer.stop()
+        self.current_plot_data = None
+        self.redraw_pending = False
         for axis in self.figure.axes:
             axis.clear()
-        self.canvas.draw()
+        self.canvas.draw_idle()
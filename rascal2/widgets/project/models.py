@@ -3,6 +3,7 @@
 import contextlib
 import re
 from enum import Enum
+from functools import cache
 from pathlib import Path
 
 import pydantic
@@ -15,6 +16,12 @@ from rascal2.config import path_for
 from rascal2.dialogs.custom_file_editor import edit_file, edit_file_matlab
 
 
+@cache
+def delete_icon() -> QtGui.QIcon:
+    """Get the icon for delete buttons, which is loaded from disk on first use and shared after."""
+    return QtGui.QIcon(path_for("delete.png"))
+
+
 class ClassListModel(QtCore.QAbstractTableModel):
     """Table model for a project ClassList field.
 
@@ -29,6 +36,9 @@ class ClassListModel(QtCore.QAbstractTableModel):
 
     """
 
+    # rows are exposed to the view in batches, so large classlists only load what is visible
+    batch_size = 50
+
     def __init__(self, classlist: RATapi.ClassList, parent: QtWidgets.QWidget):
         super().__init__(parent)
         self.parent = parent
@@ -36,6 +46,7 @@ class ClassListModel(QtCore.QAbstractTableModel):
         self.classlist: RATapi.ClassList
         self.item_type: type
         self.headers: list[str]
+        self.loaded_rows: int
 
         self.setup_classlist(classlist)
         self.edit_mode = False
@@ -47,22 +58,38 @@ class ClassListModel(QtCore.QAbstractTableModel):
         if not issubclass(self.item_type, pydantic.BaseModel):
             raise NotImplementedError("ClassListModel only works for classlists of Pydantic models!")
         self.headers = list(self.item_type.model_fields)
+        self.loaded_rows = min(len(classlist), self.batch_size)
 
     def rowCount(self, parent=None) -> int:
-        return len(self.classlist)
+        return self.loaded_rows
+
+    def canFetchMore(self, parent=None) -> bool:
+        return self.loaded_rows < len(self.classlist)
+
+    def fetchMore(self, parent=None):
+        batch = min(self.batch_size, len(self.classlist) - self.loaded_rows)
+        if batch <= 0:
+            return
+        self.beginInsertRows(QtCore.QModelIndex(), self.loaded_rows, self.loaded_rows + batch - 1)
+        self.loaded_rows += batch
+        self.endInsertRows()
 
     def columnCount(self, parent=None) -> int:
         return len(self.headers) + 1
 
     def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        # views query many roles (font, alignment, size hint...) for every visible cell,
+        # so return early for the ones we don't provide before touching the classlist
+        if role not in (QtCore.Qt.ItemDataRole.DisplayRole, QtCore.Qt.ItemDataRole.CheckStateRole):
+            return None
+
         param = self.index_header(index)
 
         if param is None:
             return None
 
-        data = getattr(self.classlist[index.row()], param)
-
-        if role == QtCore.Qt.ItemDataRole.DisplayRole and self.index_header(index) != "fit":
+        is_fit = param == "fit"
+        if role == QtCore.Qt.ItemDataRole.DisplayRole and not is_fit:
             data = getattr(self.classlist[index.row()], param)
             # pyqt can't automatically coerce enums to strings...
             if isinstance(data, Enum):
@@ -70,7 +97,8 @@ class ClassListModel(QtCore.QAbstractTableModel):
             if isinstance(data, list):
                 return ", ".join(data)
             return data
-        elif role == QtCore.Qt.ItemDataRole.CheckStateRole and self.index_header(index) == "fit":
+        elif role == QtCore.Qt.ItemDataRole.CheckStateRole and is_fit:
+            data = getattr(self.classlist[index.row()], param)
             return QtCore.Qt.CheckState.Checked if data else QtCore.Qt.CheckState.Unchecked
 
     def setData(self, index, value, role=QtCore.Qt.ItemDataRole.EditRole) -> bool:
@@ -108,8 +136,16 @@ class ClassListModel(QtCore.QAbstractTableModel):
 
     def append_item(self):
         """Append an item to the ClassList."""
-        self.classlist.append(self.item_type())
-        self.endResetModel()
+        # any rows not yet fetched are loaded along with the new one, so that it is visible
+        row = len(self.classlist)
+        self.beginInsertRows(QtCore.QModelIndex(), self.loaded_rows, row)
+        self.classlist.append(self.new_item())
+        self.loaded_rows = row + 1
+        self.endInsertRows()
+
+    def new_item(self) -> pydantic.BaseModel:
+        """Create a default item to append to the ClassList."""
+        return self.item_type()
 
     def delete_item(self, row: int):
         """Delete an item in the ClassList.
@@ -120,8 +156,10 @@ class ClassListModel(QtCore.QAbstractTableModel):
             The row containing the item to delete.
 
         """
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
         self.classlist.pop(row)
-        self.endResetModel()
+        self.loaded_rows -= 1
+        self.endRemoveRows()
 
     def index_header(self, index):
         """Get the header for an index.
@@ -162,10 +200,12 @@ class ProjectFieldWidget(QtWidgets.QWidget):
         self.field = field
         header = field.replace("_", " ").title()
         self.parent = parent
+        self.model = None
         self.table = QtWidgets.QTableView(parent)
         self.table.setSizePolicy(
             QtWidgets.QSizePolicy.Policy.MinimumExpanding, QtWidgets.QSizePolicy.Policy.MinimumExpanding
         )
+        self.table.viewport().installEventFilter(self)
 
         layout = QtWidgets.QVBoxLayout()
         topbar = QtWidgets.QHBoxLayout()
@@ -182,31 +222,92 @@ class ProjectFieldWidget(QtWidgets.QWidget):
 
     def update_model(self, classlist):
         """Update the table model to synchronise with the project field."""
+        old_model = self.model
         self.model = self.classlist_model(classlist, self)
 
         self.table.setModel(self.model)
+        # the old model is parented to this widget, so it (and any connections to it)
+        # would otherwise live as long as the widget does
+        if old_model is not None:
+            old_model.deleteLater()
+        self.model.rowsInserted.connect(self.handle_rows_inserted)
         self.table.hideColumn(0)
         self.set_item_delegates()
         header = self.table.horizontalHeader()
 
         header.setSectionResizeMode(self.model.headers.index("name") + 1, QtWidgets.QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
+        self.fetch_visible_rows()
+
+    def fetch_visible_rows(self):
+        """Load batches of rows into the model until the table viewport is filled.
+
+        Qt only fetches more rows when the table is scrolled to the bottom or the last loaded row
+        is visible in column 0, which is hidden; so rows which would fit in the viewport without a
+        scrollbar need fetching here.
+
+        """
+        if self.model is None:
+            return
+        viewport_height = self.table.viewport().height()
+        while self.model.canFetchMore():
+            last_row = self.model.rowCount() - 1
+            if (
+                last_row >= 0
+                and self.table.rowViewportPosition(last_row) + self.table.rowHeight(last_row) > viewport_height
+            ):
+                break
+            self.model.fetchMore()
+
+    def eventFilter(self, obj, event) -> bool:
+        """Event filter to load more rows when the table viewport is resized.
+
+        Parameters
+        ----------
+        obj
+            The object emitting the event.
+        event
+            The event being emitted.
+
+        Returns
+        -------
+        bool
+            True if the event was handled, False otherwise.
+
+        """
+        if obj is self.table.viewport() and event.type() == QtCore.QEvent.Type.Resize:
+            self.fetch_visible_rows()
+        return super().eventFilter(obj, event)
 
     def set_item_delegates(self):
         """Set item delegates and open persistent editors for the table."""
         for i, header in enumerate(self.model.headers):
-            self.table.setItemDelegateForColumn(
+            self.set_column_delegate(
                 i + 1, delegates.ValidatedInputDelegate(self.model.item_type.model_fields[header], self.table)
             )
 
+    def set_column_delegate(self, column: int, delegate: QtWidgets.QAbstractItemDelegate):
+        """Set the item delegate for a column of the table, deleting the delegate it replaces.
+
+        Parameters
+        ----------
+        column : int
+            The column to set the delegate for.
+        delegate : QtWidgets.QAbstractItemDelegate
+            The new delegate for the column.
+
+        """
+        old_delegate = self.table.itemDelegateForColumn(column)
+        self.table.setItemDelegateForColumn(column, delegate)
+        if old_delegate is not None and old_delegate is not delegate:
+            old_delegate.deleteLater()
+
+    @QtCore.pyqtSlot()
     def append_item(self):
         """Append an item to the model if the model exists."""
         if self.model is not None:
             self.model.append_item()
 
-        # call edit again to recreate delete buttons
-        self.edit()
-
     def delete_item(self, index):
         """Delete an item at the index if the model exists.
 
@@ -218,6 +319,7 @@ class ProjectFieldWidget(QtWidgets.QWidget):
         """
         if self.model is not None:
             self.model.delete_item(index)
+            self.fetch_visible_rows()
 
         # call edit again to recreate delete buttons
         self.edit()
@@ -229,11 +331,42 @@ class ProjectFieldWidget(QtWidgets.QWidget):
         self.table.showColumn(0)
         self.set_item_delegates()
         for i in range(0, self.model.rowCount()):
-            self.table.setIndexWidget(self.model.index(i, 0), self.make_delete_button(i))
+            self.setup_row_widgets(i)
+
+    @QtCore.pyqtSlot(QtCore.QModelIndex, int, int)
+    def handle_rows_inserted(self, parent: QtCore.QModelIndex, first: int, last: int):
+        """Create edit mode widgets for rows which have been appended or fetched.
+
+        Existing rows are unchanged, so only the new rows need widgets creating.
+
+        Parameters
+        ----------
+        parent : QtCore.QModelIndex
+            The parent index of the inserted rows.
+        first : int
+            The first inserted row.
+        last : int
+            The last inserted row.
+
+        """
+        if self.model.edit_mode:
+            for row in range(first, last + 1):
+                self.setup_row_widgets(row)
+
+    def setup_row_widgets(self, row: int):
+        """Create the edit mode widgets for a row of the table.
+
+        Parameters
+        ----------
+        row : int
+            The row to create widgets for.
+
+        """
+        self.table.setIndexWidget(self.model.index(row, 0), self.make_delete_button(row))
 
     def make_delete_button(self, index):
         """Make a button that deletes index `index` from the list."""
-        button = QtWidgets.QPushButton(icon=QtGui.QIcon(path_for("delete.png")))
+        button = QtWidgets.QPushButton(icon=delete_icon())
         button.resize(button.sizeHint().width(), button.sizeHint().width())
         button.pressed.connect(lambda: self.delete_item(index))
 
@@ -293,9 +426,9 @@ class ParameterFieldWidget(ProjectFieldWidget):
     def set_item_delegates(self):
         for i, header in enumerate(self.model.headers):
             if header in ["min", "value", "max"]:
-                self.table.setItemDelegateForColumn(i + 1, delegates.ValueSpinBoxDelegate(header, self.table))
+                self.set_column_delegate(i + 1, delegates.ValueSpinBoxDelegate(header, self.table))
             else:
-                self.table.setItemDelegateForColumn(
+                self.set_column_delegate(
                     i + 1, delegates.ValidatedInputDelegate(self.model.item_type.model_fields[header], self.table)
                 )
 
@@ -323,11 +456,10 @@ class ParameterFieldWidget(ProjectFieldWidget):
             else:
                 self.table.hideColumn(index + 1)
 
-    def edit(self):
-        super().edit()
-        for i in range(0, self.model.rowCount()):
-            if i in self.model.protected_indices:
-                self.table.setIndexWidget(self.model.index(i, 0), None)
+    def setup_row_widgets(self, row: int):
+        # protected parameters cannot be deleted
+        if row not in self.model.protected_indices:
+            super().setup_row_widgets(row)
 
 
 class LayersModel(ClassListModel):
@@ -344,12 +476,11 @@ class LayersModel(ClassListModel):
             flags |= QtCore.Qt.ItemFlag.ItemIsEditable
         return flags
 
-    def append_item(self):
+    def new_item(self):
         kwargs = {"thickness": "", "SLD": "", "roughness": ""}
         if self.absorption:
             kwargs["SLD_imaginary"] = ""
-        self.classlist.append(self.item_type(**kwargs))
-        self.endResetModel()
+        return self.item_type(**kwargs)
 
     def set_absorption(self, absorption: bool):
         """Set whether the project is using absorption or not.
@@ -421,11 +552,11 @@ class LayerFieldWidget(ProjectFieldWidget):
         for i in range(1, self.model.columnCount()):
             if i in [1, self.model.columnCount() - 1]:
                 header = self.model.headers[i - 1]
-                self.table.setItemDelegateForColumn(
+                self.set_column_delegate(
                     i, delegates.ValidatedInputDelegate(self.model.item_type.model_fields[header], self.table)
                 )
             else:
-                self.table.setItemDelegateForColumn(i, delegates.ParametersDelegate(self.project_widget, self.table))
+                self.set_column_delegate(i, delegates.ParametersDelegate(self.project_widget, self.table))
 
     def set_absorption(self, absorption: bool):
         """Set whether the classlist uses AbsorptionLayers.
@@ -468,10 +599,10 @@ class DomainContrastWidget(ProjectFieldWidget):
         header.setSectionResizeMode(2, QtWidgets.QHeaderView.ResizeMode.Stretch)
 
     def set_item_delegates(self):
-        self.table.setItemDelegateForColumn(
+        self.set_column_delegate(
             1, delegates.ValidatedInputDelegate(self.model.item_type.model_fields["name"], self.table)
         )
-        self.table.setItemDelegateForColumn(2, delegates.MultiSelectLayerDelegate(self.project_widget, self.table))
+        self.set_column_delegate(2, delegates.MultiSelectLayerDelegate(self.project_widget, self.table))
 
 
 class CustomFileModel(ClassListModel):
@@ -545,10 +676,8 @@ class CustomFileModel(ClassListModel):
 
         return super().setData(index, value, role)
 
-    def append_item(self):
-        """Append an item to the ClassList."""
-        self.classlist.append(self.item_type(filename="", path="/"))
-        self.endResetModel()
+    def new_item(self):
+        return self.item_type(filename="", path="/")
 
     def index_header(self, index):
         if index.column() == self.columnCount() - 1:
@@ -564,26 +693,21 @@ class CustomFileWidget(ProjectFieldWidget):
         self.table.hideColumn(self.model.columnCount() - 1)
 
     def edit(self):
-        super().edit()
-        edit_file_column = self.model.columnCount() - 1
-        self.table.showColumn(edit_file_column)
+        self.table.showColumn(self.model.columnCount() - 1)
         # disconnect from old table's buttons so they don't create dangling references
         # if no connections currently exist (i.e. table empty), disconnect() raises a TypeError
         with contextlib.suppress(TypeError):
             self.model.dataChanged.disconnect()
-        for i in range(0, self.model.rowCount()):
-            self.table.setIndexWidget(self.model.index(i, edit_file_column), self.make_edit_button(i))
+        super().edit()
+
+    def setup_row_widgets(self, row: int):
+        super().setup_row_widgets(row)
+        self.table.setIndexWidget(self.model.index(row, self.model.columnCount() - 1), self.make_edit_button(row))
 
     def make_edit_button(self, index):
         button = QtWidgets.QPushButton("Edit File", self.table)
         q_scintilla_action = QtGui.QAction("Edit in RasCAL-2...", self.table)
-        q_scintilla_action.triggered.connect(
-            lambda: edit_file(
-                self.model.classlist[index].path / self.model.classlist[index].filename,
-                self.model.classlist[index].language,
-                self,
-            )
-        )
+        q_scintilla_action.triggered.connect(lambda: self.edit_custom_file(index))
         matlab_action = QtGui.QAction("Edit in MATLAB...", self.table)
         matlab_action.triggered.connect(
             lambda: edit_file_matlab(self.model.classlist[index].path / self.model.classlist[index].filename)
@@ -591,39 +715,61 @@ class CustomFileWidget(ProjectFieldWidget):
         menu = QtWidgets.QMenu(self.table)
         menu.addActions([q_scintilla_action, matlab_action])
 
-        def setup_button():
-            """Check whether the button should be editable and set it up for the right language."""
-            language = self.model.data(self.model.index(index, self.model.headers.index("language") + 1))
-            with contextlib.suppress(TypeError):
-                button.pressed.disconnect()
-            if language == Languages.Matlab:
-                button.setMenu(menu)
-                button.pressed.connect(button.showMenu)
-            else:
-                button.setMenu(None)
-                button.pressed.connect(
-                    lambda: edit_file(
-                        self.model.classlist[index].path / self.model.classlist[index].filename,
-                        self.model.classlist[index].language,
-                        self,
-                    )
-                )
-
-            editable = (language in [Languages.Matlab, Languages.Python]) and (
-                self.model.data(self.model.index(index, self.model.headers.index("filename") + 1)) != "Browse..."
-            )
-            button.setEnabled(editable)
+        def update_button(top_left, bottom_right):
+            # only the row belonging to this button can change how it is set up
+            if top_left.row() <= index <= bottom_right.row():
+                self.setup_edit_button(button, menu, index)
 
-        setup_button()
-        self.model.dataChanged.connect(lambda: setup_button())
+        self.setup_edit_button(button, menu, index)
+        self.model.dataChanged.connect(update_button)
 
         return button
 
+    def setup_edit_button(self, button: QtWidgets.QPushButton, menu: QtWidgets.QMenu, index: int):
+        """Check whether an edit button should be editable and set it up for the right language.
+
+        Parameters
+        ----------
+        button : QtWidgets.QPushButton
+            The edit button to set up.
+        menu : QtWidgets.QMenu
+            The menu of editors for the button, used for MATLAB files.
+        index : int
+            The row of the custom file edited by the button.
+
+        """
+        language = self.model.data(self.model.index(index, self.model.headers.index("language") + 1))
+        with contextlib.suppress(TypeError):
+            button.pressed.disconnect()
+        if language == Languages.Matlab:
+            button.setMenu(menu)
+            button.pressed.connect(button.showMenu)
+        else:
+            button.setMenu(None)
+            button.pressed.connect(lambda: self.edit_custom_file(index))
+
+        editable = (language in [Languages.Matlab, Languages.Python]) and (
+            self.model.data(self.model.index(index, self.model.headers.index("filename") + 1)) != "Browse..."
+        )
+        button.setEnabled(editable)
+
+    def edit_custom_file(self, index: int):
+        """Open a custom file in the RasCAL-2 editor.
+
+        Parameters
+        ----------
+        index : int
+            The row of the custom file to edit.
+
+        """
+        custom_file = self.model.classlist[index]
+        edit_file(custom_file.path / custom_file.filename, custom_file.language, self)
+
     def set_item_delegates(self):
         super().set_item_delegates()
         filename_index = self.model.headers.index("filename") + 1
         function_index = self.model.headers.index("function_name") + 1
-        self.table.setItemDelegateForColumn(
+        self.set_column_delegate(
             filename_index, delegates.ValidatedInputDelegate(self.model.item_type.model_fields["path"], self.table)
         )
-        self.table.setItemDelegateForColumn(function_index, delegates.CustomFileFunctionDelegate(self))
+        self.set_column_delegate(function_index, delegates.CustomFileFunctionDelegate(self))
@@ -201,9 +201,9 @@ class ProjectWidget(QtWidgets.QWidget):
             lambda s: self.update_draft_project({"absorption": s == QtCore.Qt.CheckState.Checked})
         )
         self.calculation_combobox.currentTextChanged.connect(lambda s: self.update_draft_project({"calculation": s}))
-        self.calculation_combobox.currentTextChanged.connect(lambda: self.handle_tabs())
+        self.calculation_combobox.currentTextChanged.connect(self.handle_tabs)
         self.model_combobox.currentTextChanged.connect(lambda s: self.update_draft_project({"model": s}))
-        self.model_combobox.currentTextChanged.connect(lambda: self.handle_tabs())
+        self.model_combobox.currentTextChanged.connect(self.handle_tabs)
         self.geometry_combobox.currentTextChanged.connect(lambda s: self.update_draft_project({"geometry": s}))
         self.edit_project_tab = QtWidgets.QTabWidget()
 
@@ -221,6 +221,7 @@ class ProjectWidget(QtWidgets.QWidget):
 
         return edit_project_widget
 
+    @QtCore.pyqtSlot()
     def update_project_view(self) -> None:
         """Updates the project view."""
         # draft project is a dict containing all the attributes of the parent model,
@@ -232,10 +233,19 @@ class ProjectWidget(QtWidgets.QWidget):
         self.model_type.setText(self.parent_model.project.model)
         self.geometry_type.setText(self.parent_model.project.geometry)
 
-        self.edit_absorption_checkbox.setChecked(self.parent_model.project.absorption)
-        self.calculation_combobox.setCurrentText(self.parent_model.project.calculation)
-        self.model_combobox.setCurrentText(self.parent_model.project.model)
-        self.geometry_combobox.setCurrentText(self.parent_model.project.geometry)
+        # these widgets are being synchronised with the draft project rather than edited,
+        # so block their signals to avoid writing the same values back to the draft project;
+        # the layers and tabs are updated below
+        with (
+            QtCore.QSignalBlocker(self.edit_absorption_checkbox),
+            QtCore.QSignalBlocker(self.calculation_combobox),
+            QtCore.QSignalBlocker(self.model_combobox),
+            QtCore.QSignalBlocker(self.geometry_combobox),
+        ):
+            self.edit_absorption_checkbox.setChecked(self.parent_model.project.absorption)
+            self.calculation_combobox.setCurrentText(self.parent_model.project.calculation)
+            self.model_combobox.setCurrentText(self.parent_model.project.model)
+            self.geometry_combobox.setCurrentText(self.parent_model.project.geometry)
 
         for tab in self.tabs:
             self.view_tabs[tab].update_model(self.draft_project)
@@ -256,6 +266,7 @@ class ProjectWidget(QtWidgets.QWidget):
         """
         self.draft_project.update(new_values)
 
+    @QtCore.pyqtSlot()
     def handle_tabs(self) -> None:
         """Displays or hides tabs as relevant."""
         # the domains tab should only be visible if calculating domains
@@ -272,6 +283,7 @@ class ProjectWidget(QtWidgets.QWidget):
         self.view_tabs["Domains"].tables["domain_contrasts"].setVisible(is_layers)
         self.edit_tabs["Domains"].tables["domain_contrasts"].setVisible(is_layers)
 
+    @QtCore.pyqtSlot()
     def handle_controls_update(self):
         """Handle updates to Controls that need to be reflected in the project."""
         if self.draft_project is None:
@@ -289,6 +301,7 @@ class ProjectWidget(QtWidgets.QWidget):
         self.parent.controls_widget.run_button.setEnabled(True)
         self.stacked_widget.setCurrentIndex(0)
 
+    @QtCore.pyqtSlot()
     def show_edit_view(self) -> None:
         """Show edit view"""
         self.setWindowTitle("Edit Project")
@@ -296,6 +309,7 @@ class ProjectWidget(QtWidgets.QWidget):
         self.parent.controls_widget.run_button.setEnabled(False)
         self.stacked_widget.setCurrentIndex(1)
 
+    @QtCore.pyqtSlot()
     def save_changes(self) -> None:
         """Save changes to the project."""
         try:
@@ -341,6 +355,7 @@ class ProjectWidget(QtWidgets.QWidget):
         if errors:
             raise ValueError("\n  ".join(errors))
 
+    @QtCore.pyqtSlot()
     def cancel_changes(self) -> None:
         """Cancel changes to the project."""
         self.update_project_view()
@@ -17,6 +17,9 @@ class MockFigureCanvas(QtWidgets.QWidget):
     def draw(*args, **kwargs):
         pass
 
+    def draw_idle(*args, **kwargs):
+        pass
+
 
 @pytest.fixture
 def test_view():
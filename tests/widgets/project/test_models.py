@@ -120,6 +120,26 @@ def test_model_layout_data(table_model):
         assert model.headerData(column, QtCore.Qt.Orientation.Horizontal) == headers[column]
 
 
+@pytest.mark.parametrize(
+    "role",
+    [
+        QtCore.Qt.ItemDataRole.ToolTipRole,
+        QtCore.Qt.ItemDataRole.FontRole,
+        QtCore.Qt.ItemDataRole.SizeHintRole,
+        QtCore.Qt.ItemDataRole.TextAlignmentRole,
+    ],
+)
+def test_model_data_other_roles(table_model, role):
+    """Test that the model returns early for roles it does not provide, without looking up the item."""
+    model = table_model
+    model.index_header = MagicMock(wraps=model.index_header)
+
+    for row in [0, 1, 2]:
+        for column in [0, 1, 2]:
+            assert model.data(model.index(row, column), role) is None
+    model.index_header.assert_not_called()
+
+
 def test_model_set_data(table_model):
     """Test that data can be set successfully, but is thrown out if it breaks the Pydantic model rules."""
     model = table_model
@@ -137,9 +157,12 @@ def test_model_set_data(table_model):
 def test_append(table_model):
     """Test that append_item successfully adds an item of the relevant type."""
     model = table_model
+    rows_inserted = MagicMock()
+    model.rowsInserted.connect(rows_inserted)
 
     model.append_item()
 
+    rows_inserted.assert_called_once_with(QtCore.QModelIndex(), 3, 3)
     assert len(model.classlist) == 4
     assert model.classlist[-1].name == "Test Model"
     assert model.classlist[-1].value == 15
@@ -148,14 +171,45 @@ def test_append(table_model):
 def test_delete(table_model):
     """Test that delete_item deletes the item at the desired index."""
     model = table_model
+    rows_removed = MagicMock()
+    model.rowsRemoved.connect(rows_removed)
 
     model.delete_item(1)
 
+    rows_removed.assert_called_once_with(QtCore.QModelIndex(), 1, 1)
     assert len(model.classlist) == 2
     assert [m.name for m in model.classlist] == ["A", "C"]
     assert [m.value for m in model.classlist] == [1, 18]
 
 
+def test_fetch_more():
+    """Test that large classlists are exposed to the view in batches."""
+    classlist = RATapi.ClassList([DataModel(name=str(i), value=i) for i in range(120)])
+    model = ClassListModel(classlist, parent)
+
+    assert model.rowCount() == 50
+    assert model.canFetchMore()
+    model.fetchMore()
+    assert model.rowCount() == 100
+    model.fetchMore()
+    assert model.rowCount() == 120
+    assert not model.canFetchMore()
+
+
+def test_append_partially_loaded():
+    """Test that appending to a partially loaded model loads all rows, including the new one."""
+    classlist = RATapi.ClassList([DataModel(name=str(i), value=i) for i in range(60)])
+    model = ClassListModel(classlist, parent)
+    rows_inserted = MagicMock()
+    model.rowsInserted.connect(rows_inserted)
+
+    model.append_item()
+
+    rows_inserted.assert_called_once_with(QtCore.QModelIndex(), 50, 60)
+    assert model.rowCount() == 61
+    assert not model.canFetchMore()
+
+
 def test_project_field_init():
     """Test that the ProjectFieldWidget is initialised correctly."""
     widget = ProjectFieldWidget("test", parent)
@@ -182,6 +236,23 @@ def test_project_field_update_model(classlist):
     )
 
 
+def test_project_field_update_model_cleanup(classlist):
+    """Test that updating the model schedules the replaced model and delegates for deletion."""
+    widget = ProjectFieldWidget("test", parent)
+    widget.update_model(classlist)
+    old_model = widget.model
+    old_delegate = widget.table.itemDelegateForColumn(1)
+    destroyed = MagicMock()
+    old_model.destroyed.connect(destroyed)
+    old_delegate.destroyed.connect(destroyed)
+
+    widget.update_model(classlist)
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.Type.DeferredDelete)
+
+    assert widget.model is not old_model
+    assert destroyed.call_count == 2
+
+
 def test_edit_mode(classlist):
     """Test that edit mode makes the expected changes."""
     widget = ProjectFieldWidget("test", parent)
@@ -196,6 +267,63 @@ def test_edit_mode(classlist):
         assert isinstance(widget.table.indexWidget(widget.model.index(row, 0)), QtWidgets.QPushButton)
 
 
+def test_append_edit_mode(classlist):
+    """Test that appending an item in edit mode only creates widgets for the new row."""
+    widget = ProjectFieldWidget("test", parent)
+    widget.update_model(classlist)
+    widget.edit()
+
+    buttons = [widget.table.indexWidget(widget.model.index(row, 0)) for row in [0, 1, 2]]
+    widget.append_item()
+
+    assert len(widget.model.classlist) == 4
+    for row in [0, 1, 2]:
+        assert widget.table.indexWidget(widget.model.index(row, 0)) is buttons[row]
+    assert isinstance(widget.table.indexWidget(widget.model.index(3, 0)), QtWidgets.QPushButton)
+
+
+def test_fetch_more_edit_mode():
+    """Test that rows fetched in edit mode get delete buttons."""
+    classlist = RATapi.ClassList([DataModel(name=str(i), value=i) for i in range(60)])
+    widget = ProjectFieldWidget("test", parent)
+    widget.update_model(classlist)
+    widget.edit()
+
+    widget.model.fetchMore()
+
+    for row in [0, 49, 50, 59]:
+        assert isinstance(widget.table.indexWidget(widget.model.index(row, 0)), QtWidgets.QPushButton)
+
+
+def test_fetch_visible_rows():
+    """Test that a shown table loads the rows which fit in its viewport without being scrolled."""
+    classlist = RATapi.ClassList([DataModel(name=str(i), value=i) for i in range(60)])
+    window = MockMainWindow()
+    widget = ProjectFieldWidget("test", window)
+    window.setCentralWidget(widget)
+    widget.update_model(classlist)
+    window.resize(400, 2500)
+    window.show()
+    QtCore.QCoreApplication.processEvents()
+
+    assert widget.table.verticalScrollBar().maximum() == 0
+    assert widget.model.rowCount() == 60
+    assert not widget.model.canFetchMore()
+
+    classlist = RATapi.ClassList([DataModel(name=str(i), value=i) for i in range(200)])
+    window.resize(400, 300)
+    QtCore.QCoreApplication.processEvents()
+    widget.update_model(classlist)
+    assert widget.model.rowCount() == 50
+
+    window.resize(400, 2500)
+    QtCore.QCoreApplication.processEvents()
+    assert 50 < widget.model.rowCount() < 200
+
+    window.close()
+    window.deleteLater()
+
+
 def test_delete_button(classlist):
     """Test that delete buttons work as expected."""
     widget = ProjectFieldWidget("Test", parent)
@@ -490,3 +618,22 @@ def test_file_widget_edit(filename):
             assert len(button.menu().actions()) == 2
         else:
             assert button.menu() is None
+
+
+def test_file_widget_edit_buttons_per_row():
+    """Test that changing a custom file only updates the edit button for its own row."""
+    with tempfile.TemporaryDirectory() as tmp:
+        Path(tmp, "file.py").touch()
+        init_list = RATapi.ClassList([RATapi.models.CustomFile(filename=""), RATapi.models.CustomFile(filename="")])
+
+        widget = CustomFileWidget("files", parent)
+        widget.update_model(init_list)
+        widget.edit()
+        widget.setup_edit_button = MagicMock(wraps=widget.setup_edit_button)
+
+        widget.model.setData(widget.model.index(1, widget.model.headers.index("filename") + 1), Path(tmp, "file.py"))
+
+        edit_col = widget.model.columnCount() - 1
+        widget.setup_edit_button.assert_called_once()
+        assert not widget.table.indexWidget(widget.model.index(0, edit_col)).isEnabled()
+        assert widget.table.indexWidget(widget.model.index(1, edit_col)).isEnabled()
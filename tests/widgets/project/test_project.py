@@ -215,6 +215,22 @@ def test_cancel_changes_to_model_project(setup_project_widget):
     assert project_widget.geometry_type.text() == Geometries.AirSubstrate
 
 
+def test_update_project_view_blocks_signals(setup_project_widget):
+    """Test that synchronising the edit widgets with the project does not write back to the draft project."""
+    project_widget = setup_project_widget
+    project_widget.parent_model.project.calculation = Calculations.Domains
+    project_widget.parent_model.project.absorption = True
+    project_widget.update_draft_project = MagicMock()
+
+    project_widget.update_project_view()
+
+    project_widget.update_draft_project.assert_not_called()
+    assert project_widget.calculation_combobox.currentText() == Calculations.Domains
+    assert project_widget.edit_absorption_checkbox.isChecked()
+    assert project_widget.draft_project["calculation"] == Calculations.Domains
+    assert project_widget.project_tab.isTabVisible(5)
+
+
 def test_domains_tab(setup_project_widget):
     """
     Tests that domain tab is visible.
@@ -223,7 +239,6 @@ def test_domains_tab(setup_project_widget):
     project_widget.edit_project_button.click()
     project_widget.calculation_combobox.setCurrentText(Calculations.Domains)
     assert project_widget.draft_project["calculation"] == Calculations.Domains
-    project_widget.handle_tabs()
 
     domains_tab_index = 5
     assert project_widget.project_tab.isTabVisible(domains_tab_index)
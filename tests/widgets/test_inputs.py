@@ -1,12 +1,14 @@
 """Test input widgets."""
 
 from enum import StrEnum
+from unittest.mock import MagicMock
 
 import pytest
 from pydantic.fields import FieldInfo
-from PyQt6 import QtWidgets
+from PyQt6 import QtCore, QtWidgets
 
 from rascal2.widgets import AdaptiveDoubleSpinBox, MultiSelectComboBox, get_validated_input
+from rascal2.widgets.inputs import get_enum_items
 
 
 class MyEnum(StrEnum):
@@ -34,6 +36,26 @@ def test_editor_type(field_info, expected_type, example_data):
     assert widget.get_data() == example_data
 
 
+def test_enum_editor_data():
+    """Test that Enum editors hold the Enum members as item data, with items shared between editors."""
+    widget = get_validated_input(FieldInfo(annotation=MyEnum))
+    editor = widget.editor
+    assert [editor.itemText(i) for i in range(editor.count())] == ["value 1", "value 2", "value 3"]
+    assert [editor.itemData(i) for i in range(editor.count())] == list(MyEnum)
+    assert all(isinstance(editor.itemData(i), MyEnum) for i in range(editor.count()))
+
+    widget.set_data("value 3")
+    assert widget.get_data() is MyEnum.VALUE_3
+
+    get_enum_items.cache_clear()
+    names, members = get_enum_items(MyEnum)
+    get_validated_input(FieldInfo(annotation=MyEnum))
+    get_validated_input(FieldInfo(annotation=MyEnum))
+    assert get_enum_items.cache_info().misses == 1
+    assert get_enum_items(MyEnum) == (names, members)
+    assert get_enum_items(MyEnum)[1] is members
+
+
 @pytest.mark.parametrize(("value", "decimals"), [("10.", 0), ("1e-5", 6), ("0.01144661", 8)])
 def test_adaptive_spinbox(value, decimals):
     spinbox = AdaptiveDoubleSpinBox()
@@ -54,3 +76,37 @@ def test_multi_select_update(selected):
     expected_items = [items[i] for i in selected]
     assert combobox.selected_items() == expected_items
     assert combobox.lineEdit().text() == ", ".join(expected_items)
+
+
+class CountingComboBox(MultiSelectComboBox):
+    """A MultiSelectComboBox which counts how many times its text is updated."""
+
+    text_updates = 0
+
+    def update_text(self):
+        self.text_updates += 1
+        super().update_text()
+
+
+def test_multi_select_batch_signals():
+    """Test that adding items notifies the model once, and selecting items only updates the text once."""
+    combobox = CountingComboBox()
+    rows_inserted = MagicMock()
+    data_changed = MagicMock()
+    combobox.model().rowsInserted.connect(rows_inserted)
+    combobox.model().dataChanged.connect(data_changed)
+
+    combobox.addItems(["A", "B", "C"], ["a", "b", "c"])
+    rows_inserted.assert_called_once()
+    assert combobox.model().rowCount() == 3
+
+    combobox.text_updates = 0
+    combobox.select_indices([0, 2])
+    assert data_changed.call_count == 3
+    assert combobox.text_updates == 1
+    assert combobox.selected_items() == ["a", "c"]
+
+    # the text is still updated when the model changes outside select_indices
+    combobox.model().item(1).setCheckState(QtCore.Qt.CheckState.Checked)
+    assert combobox.text_updates == 2
+    assert combobox.lineEdit().text() == "a, b, c"
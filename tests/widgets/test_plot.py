@@ -1,8 +1,9 @@
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 import RATapi
-from PyQt6 import QtWidgets
+from PyQt6 import QtCore, QtWidgets
 
 from rascal2.widgets.plot import PlotWidget
 
@@ -16,15 +17,29 @@ class MockWindowView(QtWidgets.QMainWindow):
         self.presenter.model = MagicMock()
 
 
-view = MockWindowView()
+@pytest.fixture(scope="module")
+def view():
+    """A mock main window, created once and shared by the tests in this module."""
+    return MockWindowView()
 
 
 @pytest.fixture
-def plot_widget():
+def plot_widget(view):
     plot_widget = PlotWidget(view)
     plot_widget.canvas = MagicMock()
+    plot_widget.show()
 
-    return plot_widget
+    yield plot_widget
+
+    plot_widget.close()
+    plot_widget.deleteLater()
+
+
+def flush_draw(plot_widget):
+    """Run a scheduled draw immediately rather than waiting for the timer."""
+    assert plot_widget.draw_timer.isActive()
+    plot_widget.draw_timer.stop()
+    plot_widget.draw_plot()
 
 
 def test_toggle_setting(plot_widget):
@@ -45,6 +60,7 @@ def test_plot_event(mock_plot_sld, plot_widget):
     assert plot_widget.current_plot_data is None
     plot_widget.plot_event(data)
     assert plot_widget.current_plot_data is data
+    flush_draw(plot_widget)
     mock_plot_sld.assert_called_with(
         data,
         plot_widget.figure,
@@ -55,9 +71,10 @@ def test_plot_event(mock_plot_sld, plot_widget):
         show_grid=False,
         show_legend=True,
     )
-    plot_widget.canvas.draw.assert_called_once()
+    plot_widget.canvas.draw_idle.assert_called_once()
     data.contrastNames = []
     plot_widget.plot_event(data)
+    flush_draw(plot_widget)
     mock_plot_sld.assert_called_with(
         data,
         plot_widget.figure,
@@ -69,12 +86,15 @@ def test_plot_event(mock_plot_sld, plot_widget):
         show_legend=False,
     )
     data.contrastNames = ["Hello"]
+    mock_plot_sld.reset_mock()
     plot_widget.x_axis.setCurrentText("Linear")
     plot_widget.y_axis.setCurrentText("Q^4")
     plot_widget.show_error_bar.setChecked(False)
     plot_widget.show_grid.setChecked(True)
     plot_widget.show_legend.setChecked(False)
-    mock_plot_sld.assert_called_with(
+    mock_plot_sld.assert_not_called()
+    flush_draw(plot_widget)
+    mock_plot_sld.assert_called_once_with(
         data,
         plot_widget.figure,
         delay=False,
@@ -86,6 +106,123 @@ def test_plot_event(mock_plot_sld, plot_widget):
     )
 
 
+@patch("RATapi.plotting.RATapi.plotting.plot_ref_sld_helper")
+def test_plot_event_stream(mock_plot_sld, plot_widget):
+    """Test that a steady stream of plot events is drawn during the stream rather than only after it."""
+    data = RATapi.events.PlotEventData()
+    data.contrastNames = ["Hello"]
+
+    end_time = time.monotonic() + 0.3
+    while time.monotonic() < end_time:
+        plot_widget.plot_event(data)
+        QtCore.QCoreApplication.processEvents()
+        time.sleep(0.005)
+
+    assert mock_plot_sld.call_count > 1
+
+
+@patch("RATapi.plotting.RATapi.plotting.plot_ref_sld_helper")
+def test_plot_event_hidden(mock_plot_sld, plot_widget):
+    """Test that a hidden plot widget only draws when it is shown again."""
+    data = RATapi.events.PlotEventData()
+    data.contrastNames = ["Hello"]
+
+    plot_widget.hide()
+    plot_widget.plot_event(data)
+    flush_draw(plot_widget)
+    assert plot_widget.current_plot_data is data
+    assert plot_widget.redraw_pending
+    mock_plot_sld.assert_not_called()
+    plot_widget.canvas.draw_idle.assert_not_called()
+
+    plot_widget.show()
+    assert not plot_widget.redraw_pending
+    mock_plot_sld.assert_called_once()
+    plot_widget.canvas.draw_idle.assert_called_once()
+
+
+@patch("RATapi.plotting.RATapi.plotting.plot_ref_sld_helper")
+def test_clear_hidden(mock_plot_sld, plot_widget):
+    """Test that plot data waiting for a hidden widget to be shown is not drawn after the plot is cleared."""
+    data = RATapi.events.PlotEventData()
+    data.contrastNames = ["Hello"]
+
+    plot_widget.hide()
+    plot_widget.plot_event(data)
+    flush_draw(plot_widget)
+    assert plot_widget.redraw_pending
+
+    plot_widget.clear()
+    assert not plot_widget.redraw_pending
+    assert plot_widget.current_plot_data is None
+
+    plot_widget.show()
+    mock_plot_sld.assert_not_called()
+
+
+@patch("RATapi.plotting.RATapi.plotting.plot_ref_sld_helper")
+def test_plot_layout(mock_plot_sld, plot_widget):
+    """Test that the figure layout is only recalculated on the first draw and after the canvas is resized."""
+    plot_widget.figure.tight_layout = MagicMock()
+    data = RATapi.events.PlotEventData()
+    data.contrastNames = ["Hello"]
+
+    plot_widget.plot_event(data)
+    flush_draw(plot_widget)
+    plot_widget.figure.tight_layout.assert_called_once()
+
+    plot_widget.show_grid.setChecked(True)
+    flush_draw(plot_widget)
+    plot_widget.figure.tight_layout.assert_called_once()
+
+    plot_widget.resize(plot_widget.width() + 50, plot_widget.height())
+    QtCore.QCoreApplication.processEvents()
+    assert plot_widget.layout_outdated
+    plot_widget.figure.tight_layout.assert_called_once()
+
+    plot_widget.plot_event()
+    flush_draw(plot_widget)
+    assert plot_widget.figure.tight_layout.call_count == 2
+    assert not plot_widget.layout_outdated
+
+
+@patch("RATapi.plotting.RATapi.plotting.plot_ref_sld_helper")
+def test_plot_layout_toggle_settings(mock_plot_sld, plot_widget):
+    """Test that the figure layout is recalculated when showing the settings panel resizes the canvas."""
+    plot_widget.figure.tight_layout = MagicMock()
+    data = RATapi.events.PlotEventData()
+    data.contrastNames = ["Hello"]
+
+    plot_widget.plot_event(data)
+    flush_draw(plot_widget)
+    plot_widget.figure.tight_layout.assert_called_once()
+
+    plot_widget.toggle_button.toggle()
+    QtCore.QCoreApplication.processEvents()
+    assert plot_widget.layout_outdated
+
+    plot_widget.plot_event()
+    flush_draw(plot_widget)
+    assert plot_widget.figure.tight_layout.call_count == 2
+
+
+@patch("RATapi.plotting.RATapi.plotting.plot_ref_sld_helper")
+def test_plot_layout_reapplied(mock_plot_sld, plot_widget):
+    """Test that the computed layout is reapplied after the plot helper changes the subplot spacing."""
+    mock_plot_sld.side_effect = lambda data, figure, **kwargs: figure.subplots_adjust(wspace=0.3)
+    data = RATapi.events.PlotEventData()
+    data.contrastNames = ["Hello"]
+
+    plot_widget.plot_event(data)
+    flush_draw(plot_widget)
+    wspace = plot_widget.figure.subplotpars.wspace
+    assert wspace != 0.3
+
+    plot_widget.show_grid.setChecked(True)
+    flush_draw(plot_widget)
+    assert plot_widget.figure.subplotpars.wspace == wspace
+
+
 @patch("RATapi.inputs.make_input")
 def test_plot(mock_inputs, plot_widget):
     """Test that plot settings are hidden when the button is toggled."""
@@ -96,4 +233,27 @@ def test_plot(mock_inputs, plot_widget):
         assert plot_widget.current_plot_data is None
         plot_widget.plot(project, result)
         assert plot_widget.current_plot_data is data
-        plot_widget.canvas.draw.assert_called_once()
+        flush_draw(plot_widget)
+        plot_widget.canvas.draw_idle.assert_called_once()
+
+
+@patch("RATapi.inputs.make_resample")
+@patch("RATapi.inputs.make_data_present")
+def test_plot_project_inputs(mock_data_present, mock_resample, plot_widget):
+    """Test that project-dependent plot inputs are cached until the project changes."""
+    project = MagicMock()
+    result = MagicMock()
+    with patch("RATapi.events.PlotEventData", return_value=MagicMock()):
+        plot_widget.plot(project, result)
+        plot_widget.plot(project, result)
+        mock_data_present.assert_called_once_with(project)
+        mock_resample.assert_called_once_with(project)
+
+        plot_widget.clear_project_inputs()
+        plot_widget.plot(project, result)
+        assert mock_data_present.call_count == 2
+
+        new_project = MagicMock()
+        plot_widget.plot(new_project, result)
+        assert mock_data_present.call_count == 3
+        mock_data_present.assert_called_with(new_project)